@@ -17,7 +17,6 @@ from typing import Optional
 from click import command, option
 
 from lean.click import LeanCommand, PathParameter
-from lean.constants import PROJECT_CONFIG_FILE_NAME
 from lean.container import container
 from lean.models.encryption import ActionType
 
@@ -67,5 +66,5 @@ def push(project: Optional[Path], encrypt: Optional[bool], decrypt: Optional[boo
     else:
         if key is not None:
             raise RuntimeError(f"Encryption key can only be specified when pushing a single project.")
-        projects_to_push = [p.parent for p in Path.cwd().rglob(PROJECT_CONFIG_FILE_NAME)]
+        projects_to_push = container.project_manager.get_local_projects(Path.cwd())
         push_manager.push_projects(projects_to_push, [], encryption_action, key)
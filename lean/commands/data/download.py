@@ -13,7 +13,6 @@
 from datetime import datetime
 from json import dump
 
-from docker.types import Mount
 from typing import Any, Dict, Iterable, List, Optional
 from click import command, option, confirm, pass_context, Context, Choice
 from lean.click import LeanCommand, ensure_options
@@ -711,6 +710,7 @@ def download(ctx: Context,
         run_options["commands"].append(' '.join(dll_arguments))
 
         # mount our created above config with work directory
+        from docker.types import Mount
         run_options["mounts"].append(
             Mount(target=f"{downloader_data_provider_path_dll}/config.json",
                   source=str(config_path),
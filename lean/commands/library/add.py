@@ -297,7 +297,8 @@ def add(project: Path, name: str, version: Optional[str], no_local: bool) -> Non
     $ lean library add "My Python Project" "Library/My Python Library"
     """
     logger = container.logger
-    project_config = container.project_config_manager.get_project_config(project)
+    project_config_manager = container.project_config_manager
+    project_config = project_config_manager.get_project_config(project)
     project_language = project_config.get("algorithm-language", None)
 
     if project_language is None:
@@ -313,7 +314,7 @@ def add(project: Path, name: str, version: Optional[str], no_local: bool) -> Non
         project_encryption_key_path = project_config.get('encryption-key-path', None)
         if is_project_encrypted and project_encryption_key_path:
             from lean.components.util.encryption_helper import are_encryption_keys_equal
-            library_project_config = container.project_config_manager.get_project_config(library_dir)
+            library_project_config = project_config_manager.get_project_config(library_dir)
             is_library_encrypted = library_project_config.get('encrypted', False)
             library_encryption_key_path = library_project_config.get('encryption-key-path', None)
             if is_library_encrypted and are_encryption_keys_equal(library_encryption_key_path, project_encryption_key_path) == False:
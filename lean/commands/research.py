@@ -128,8 +128,7 @@ def research(project: Path,
     temp_manager = container.temp_manager
 
     # Set extra config
-    for key, value in extra_config:
-        lean_config[key] = value
+    lean_config.update(extra_config)
 
     project_config_manager = container.project_config_manager
     cli_config_manager = container.cli_config_manager
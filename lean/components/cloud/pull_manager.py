@@ -190,21 +190,22 @@ class PullManager:
 
         # Update the local project config with the latest details
         project_config = self._project_config_manager.get_project_config(local_project_path)
-        project_config.set("cloud-id", project.projectId)
-        project_config.set("algorithm-language", project.language.name)
-        project_config.set("parameters", {parameter.key: parameter.value for parameter in project.parameters})
-        project_config.set("description", project.description)
-        project_config.set("organization-id", project.organizationId)
-        project_config.set("python-venv", project.leanEnvironment)
-        if encryption_key:
-            project_config.set("encrypted", encryption_action == ActionType.ENCRYPT)
-        else:
-            project_config.set('encrypted', project.encrypted)
+        with project_config.batch():
+            project_config.set("cloud-id", project.projectId)
+            project_config.set("algorithm-language", project.language.name)
+            project_config.set("parameters", {parameter.key: parameter.value for parameter in project.parameters})
+            project_config.set("description", project.description)
+            project_config.set("organization-id", project.organizationId)
+            project_config.set("python-venv", project.leanEnvironment)
+            if encryption_key:
+                project_config.set("encrypted", encryption_action == ActionType.ENCRYPT)
+            else:
+                project_config.set('encrypted', project.encrypted)
 
-        if not project.leanPinnedToMaster:
-            project_config.set("lean-engine", project.leanVersionId)
-        else:
-            project_config.delete("lean-engine")
+            if not project.leanPinnedToMaster:
+                project_config.set("lean-engine", project.leanVersionId)
+            else:
+                project_config.delete("lean-engine")
 
         return local_project_path
 
@@ -20,7 +20,6 @@ from lean.components.util.logger import Logger
 from lean.components.util.organization_manager import OrganizationManager
 from lean.components.util.project_manager import ProjectManager
 from lean.models.api import QCLanguage, QCProject
-from lean.models.utils import LeanLibraryReference
 from lean.models.encryption import ActionType
 
 class PushManager:
@@ -88,7 +87,7 @@ class PushManager:
         project_config = self._project_config_manager.get_project_config(project_dir)
 
         libraries_in_config = project_config.get("libraries", [])
-        library_paths = [LeanLibraryReference(**library).path.expanduser().resolve() for library in libraries_in_config]
+        library_paths = [Path(library["path"]).expanduser().resolve() for library in libraries_in_config]
 
         local_libraries_cloud_ids = [int(self._project_config_manager.get_project_config(path).get("cloud-id", None))
                                      for path in library_paths]
@@ -143,8 +142,9 @@ class PushManager:
             cloud_project = self._api_client.projects.create(project_name,
                                                              QCLanguage[project_config.get("algorithm-language")],
                                                              organization_id)
-            project_config.set("cloud-id", cloud_project.projectId)
-            project_config.set("organization-id", cloud_project.organizationId)
+            with project_config.batch():
+                project_config.set("cloud-id", cloud_project.projectId)
+                project_config.set("organization-id", cloud_project.organizationId)
 
             if cloud_project.name != project_name:
                 # cloud project name was changed. Repeat steps to validate the new name locally.
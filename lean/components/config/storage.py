@@ -11,8 +11,33 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterator
+
+try:
+    # orjson is an optional dependency which parses JSON considerably faster than the json module
+    from orjson import loads as _orjson_loads
+except ImportError:
+    _orjson_loads = None
+
+
+def _parse_json(content: bytes) -> Any:
+    """Parses JSON content, preferring orjson when it is installed.
+
+    Falls back to the json module when orjson rejects the content, like when it contains NaN values.
+
+    :param content: the raw JSON content to parse
+    :return: the parsed content
+    """
+    if _orjson_loads is not None:
+        try:
+            return _orjson_loads(content)
+        except ValueError:
+            pass
+
+    from json import loads
+    return loads(content)
 
 
 def safe_save(data: str, path: Path, _retry: int = 0):
@@ -57,15 +82,15 @@ class Storage:
 
         :param file: the path to the file this Storage instance should manage
         """
-        from json import loads
-
         self.file = Path(file)
+        self._batch_depth = 0
+        self._has_unsaved_changes = False
 
         if self.file.exists():
             try:
-                content = self.file.read_text(encoding="utf-8")
+                content = self.file.read_bytes()
                 if content:
-                    self._data = loads(content)
+                    self._data = _parse_json(content)
                 else:
                     self._data = {}
             except:
@@ -123,6 +148,20 @@ class Storage:
         """
         return key in self._data
 
+    @contextmanager
+    def batch(self) -> Iterator[None]:
+        """Defers saving the data to the underlying file until the end of the with-block.
+
+        Changes made inside the block are written to the file at once instead of once per change.
+        """
+        self._batch_depth += 1
+        try:
+            yield
+        finally:
+            self._batch_depth -= 1
+            if self._batch_depth == 0 and self._has_unsaved_changes:
+                self._save()
+
     def clear(self) -> None:
         """Clears the Storage instance and deletes the underlying file."""
         self._data.clear()
@@ -132,6 +171,11 @@ class Storage:
         from json import dumps
 
         """Saves the data to the underlying file, deleting the file if there is no data."""
+        if self._batch_depth > 0:
+            self._has_unsaved_changes = True
+            return
+
+        self._has_unsaved_changes = False
         if len(self._data) > 0:
             safe_save(data=dumps(self._data, indent=4) + "\n", path=self.file.resolve())
         else:
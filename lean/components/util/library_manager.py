@@ -108,14 +108,14 @@ class LibraryManager:
         project_libraries = project_config.get("libraries", [])
         library_relative_path = Path(self.get_library_path_for_project_config_file(library_dir))
 
-        if any(LeanLibraryReference(**library).path == library_relative_path for library in project_libraries):
+        if any(Path(library["path"]) == library_relative_path for library in project_libraries):
             return True
 
         library_config = self._project_config_manager.get_project_config(library_dir)
         library_libraries = library_config.get("libraries", [])
         project_relative_path = Path(self.get_library_path_for_project_config_file(project_dir))
 
-        if any(LeanLibraryReference(**library).path == project_relative_path for library in library_libraries):
+        if any(Path(library["path"]) == project_relative_path for library in library_libraries):
             raise RuntimeError("Circular dependency detected between "
                                f"{project_relative_path} and {library_relative_path}")
 
@@ -139,7 +139,7 @@ class LibraryManager:
         library_relative_path = Path(self.get_library_path_for_project_config_file(library_dir))
         project_config = self._project_config_manager.get_project_config(project_dir)
         libraries = project_config.get("libraries", [])
-        libraries = [library for library in libraries if LeanLibraryReference(**library).path != library_relative_path]
+        libraries = [library for library in libraries if Path(library["path"]) != library_relative_path]
         project_config.set("libraries", libraries)
 
     def add_lean_library_to_csharp_project(self, project_dir: Path, library_dir: Path, no_local: bool) -> None:
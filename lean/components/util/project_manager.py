@@ -11,9 +11,11 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from collections import deque
 from datetime import datetime
+from os import scandir, path as os_path
 from pathlib import Path
-from typing import List, Optional, Union, Tuple
+from typing import Collection, Dict, Iterator, List, Optional, Union, Tuple
 from lean.components import reserved_names
 from lean.components.config.cli_config_manager import CLIConfigManager
 from lean.components.config.lean_config_manager import LeanConfigManager
@@ -25,7 +27,94 @@ from lean.components.util.platform_manager import PlatformManager
 from lean.components.util.xml_manager import XMLManager
 from lean.constants import PROJECT_CONFIG_FILE_NAME, DEFAULT_LEAN_DOTNET_FRAMEWORK
 from lean.models.api import QCLanguage, QCProject, QCProjectLibrary
-from lean.models.utils import LeanLibraryReference
+
+
+# The names of directories which never contain projects, these are skipped when searching for projects
+_IGNORED_DIRECTORY_NAMES = frozenset({
+    ".git", ".idea", ".vs", ".vscode", ".venv", "venv", "__pycache__", "node_modules", "bin", "obj"
+})
+
+# The names of the directories Lean stores the output of a project in, these are skipped inside project directories
+_IGNORED_PROJECT_DIRECTORY_NAMES = _IGNORED_DIRECTORY_NAMES | frozenset({
+    "backtests", "live", "optimizations", "storage"
+})
+
+
+def _iter_project_dirs(root: str) -> Iterator[str]:
+    """Yields the paths of all the project directories in a directory, recursively.
+
+    Uses os.scandir instead of Path.rglob so every directory is only stat-ed once and no Path objects are created
+    for the (usually many) directories which are not projects.
+
+    :param root: the path to the directory to search in
+    :return: an iterator over the paths of all the directories containing a project config file
+    """
+    if os_path.isfile(os_path.join(root, PROJECT_CONFIG_FILE_NAME)):
+        ignored_names = _IGNORED_PROJECT_DIRECTORY_NAMES
+        yield root
+    else:
+        ignored_names = _IGNORED_DIRECTORY_NAMES
+
+    try:
+        with scandir(root) as entries:
+            directories = [entry.path for entry in entries
+                           if entry.name not in ignored_names
+                           and entry.is_dir(follow_symlinks=False)]
+    except OSError:
+        return
+
+    for directory in directories:
+        yield from _iter_project_dirs(directory)
+
+
+def _iter_workspace_project_dirs(root: str,
+                                 skipped_dirs: Collection[str],
+                                 search_project_dirs: bool) -> Iterator[str]:
+    """Yields the paths of all the project directories in a directory, breadth-first.
+
+    Unlike _iter_project_dirs, symlinked directories are followed and no directories are skipped by name,
+    so every directory a project can be looked up in by its id is searched.
+    Directories are tracked by their resolved path, so a symlink cycle does not make the search loop forever.
+
+    :param root: the path to the directory to search in
+    :param skipped_dirs: the paths of the directories which should not be searched
+    :param search_project_dirs: whether the directories inside project directories should be searched as well
+    :return: an iterator over the paths of all the directories containing a project config file
+    """
+    visited_dirs = set()
+    directories = deque([root])
+    while len(directories) > 0:
+        directory = directories.popleft()
+
+        real_path = os_path.realpath(directory)
+        if real_path in visited_dirs:
+            continue
+        visited_dirs.add(real_path)
+
+        if os_path.isfile(os_path.join(directory, PROJECT_CONFIG_FILE_NAME)):
+            yield directory
+            if not search_project_dirs:
+                continue
+
+        try:
+            with scandir(directory) as entries:
+                directories.extend(entry.path for entry in entries
+                                   if entry.is_dir() and entry.path not in skipped_dirs)
+        except OSError:
+            continue
+
+
+def _read_project_config(project_dir: str) -> bytes:
+    """Reads the raw content of a project's config file.
+
+    :param project_dir: the path to the project directory
+    :return: the content of the project's config file, or empty bytes if it cannot be read
+    """
+    try:
+        with open(os_path.join(project_dir, PROJECT_CONFIG_FILE_NAME), "rb") as config_file:
+            return config_file.read()
+    except OSError:
+        return b""
 
 
 class ProjectManager:
@@ -84,16 +173,10 @@ class ProjectManager:
         :param local_id: the local id of the project
         :return: the path to the directory containing the project with the given local id
         """
-        directories = [self._lean_config_manager.get_cli_root_directory()]
-        while len(directories) > 0:
-            directory = directories.pop(0)
-
-            config_file = directory / PROJECT_CONFIG_FILE_NAME
-            if config_file.is_file():
-                if self._project_config_manager.get_local_id(directory) == local_id:
-                    return directory
-            else:
-                directories.extend(d for d in directory.iterdir() if d.is_dir())
+        for project_dir in self._get_workspace_project_dirs(search_project_dirs=False):
+            project_path = Path(project_dir)
+            if self._project_config_manager.get_local_id(project_path) == local_id:
+                return project_path
 
         raise RuntimeError(f"Project with local id '{local_id}' does not exist")
 
@@ -105,21 +188,45 @@ class ProjectManager:
         :param cloud_id: the cloud id of the project
         :return: the path to the directory containing the project with the given cloud id
         """
-        directories = [self._lean_config_manager.get_cli_root_directory()]
-        while len(directories) > 0:
-            directory = directories.pop(0)
+        # Most project configs don't mention the cloud id at all, those are skipped without parsing them
+        needle = str(cloud_id).encode("utf-8")
 
-            try:
-                project_config = self._project_config_manager.get_project_config(directory)
-            except:
+        # The workspace is walked lazily, so the search stops walking and reading as soon as the project is found
+        for project_dir in self._get_workspace_project_dirs(search_project_dirs=True):
+            if needle not in _read_project_config(project_dir):
                 continue
-            if project_config and project_config.get("cloud-id", None) == cloud_id:
-                return directory
-            else:
-                directories.extend(d for d in directory.iterdir() if d.is_dir())
+
+            project_path = Path(project_dir)
+            project_config = self._project_config_manager.get_project_config(project_path)
+            if project_config.get("cloud-id", None) == cloud_id:
+                return project_path
 
         return False
 
+    def _get_workspace_project_dirs(self, search_project_dirs: bool) -> Iterator[str]:
+        """Returns the paths of all the projects in the CLI root directory.
+
+        The data directory is not searched, it never contains projects but it may contain a huge amount of directories.
+        The Lean config is not required to configure a data directory, in which case nothing is skipped.
+
+        :param search_project_dirs: whether the directories inside project directories should be searched as well
+        :return: an iterator over the paths of all the project directories in the CLI root directory
+        """
+        cli_root_dir = self._lean_config_manager.get_cli_root_directory()
+
+        data_folder = self._lean_config_manager.get_lean_config().get("data-folder", None)
+        skipped_dirs = [] if data_folder is None else [str(cli_root_dir / data_folder)]
+
+        return _iter_workspace_project_dirs(str(cli_root_dir), skipped_dirs, search_project_dirs)
+
+    def get_local_projects(self, directory: Path) -> List[Path]:
+        """Returns the paths of all the projects in a directory, recursively.
+
+        :param directory: the path to the directory to search for projects in
+        :return: the list of directories containing a project, including the given directory if it is a project
+        """
+        return [Path(project_dir) for project_dir in _iter_project_dirs(str(directory))]
+
     def get_source_files(self, directory: Path) -> List[Path]:
         """Returns the paths of all the source files in a directory.
 
@@ -183,9 +290,10 @@ class ProjectManager:
         project_dir.mkdir(parents=True, exist_ok=True)
 
         project_config = self._project_config_manager.get_project_config(project_dir)
-        project_config.set("algorithm-language", language.name)
-        project_config.set("parameters", {})
-        project_config.set("description", "")
+        with project_config.batch():
+            project_config.set("algorithm-language", language.name)
+            project_config.set("parameters", {})
+            project_config.set("description", "")
 
         if language == QCLanguage.Python:
             self._generate_python_library_projects_config()
@@ -322,23 +430,36 @@ class ProjectManager:
         :param project_dir: Path to the project
         :return List of all the libraries referenced by the given project
         """
-        return self._get_project_libraries(project_dir)
+        return self._get_project_libraries(project_dir, resolved_library_paths={})
 
-    def _get_project_libraries(self, project_dir: Path, seen_projects: List[Path] = None) -> List[Path]:
+    def _get_project_libraries(self,
+                               project_dir: Path,
+                               seen_projects: List[Path] = None,
+                               resolved_library_paths: Dict[str, Path] = None) -> List[Path]:
         """Returns a list of all the libraries referenced by the given project.
 
         This is a helper method to recurse the libraries and get their dependencies as well.
 
         :param project_dir: Path to the project
         :param seen_projects: List of paths already seen, which serves as recursion stop criteria
+        :param resolved_library_paths: the library reference paths resolved so far, by their path in the config
         :return List of all the libraries referenced by the given project
         """
         if seen_projects is None:
             seen_projects = [project_dir]
+        if resolved_library_paths is None:
+            resolved_library_paths = {}
 
         project_config = self._project_config_manager.get_project_config(project_dir)
-        libraries_in_config = project_config.get("libraries", [])
-        libraries = [LeanLibraryReference(**library).path.expanduser().resolve() for library in libraries_in_config]
+        libraries = []
+        for library in project_config.get("libraries", []):
+            # Libraries commonly reference the same libraries, so each path is only resolved once per call
+            library_path = resolved_library_paths.get(library["path"], None)
+            if library_path is None:
+                library_path = Path(library["path"]).expanduser().resolve()
+                resolved_library_paths[library["path"]] = library_path
+            libraries.append(library_path)
+
         referenced_libraries = []
 
         for library_path in libraries:
@@ -347,7 +468,9 @@ class ProjectManager:
                 continue
 
             seen_projects.append(library_path)
-            referenced_libraries.extend(self._get_project_libraries(library_path, seen_projects))
+            referenced_libraries.extend(self._get_project_libraries(library_path,
+                                                                    seen_projects,
+                                                                    resolved_library_paths))
             referenced_libraries.append(library_path)
 
         return referenced_libraries
@@ -61,6 +61,12 @@ install_requires = [
     "cryptography>=41.0.4,<43.0.0",
 ]
 
+# Optional dependencies
+extras_require = {
+    # Parses project configs and other JSON storage files faster, Storage falls back to the json module without it
+    "orjson": ["orjson>=3.6.0"]
+}
+
 setup(
     name="lean",
     version=get_version(),
@@ -78,6 +84,7 @@ setup(
         "console_scripts": ["lean=lean.main:main"]
     },
     install_requires=install_requires,
+    extras_require=extras_require,
     python_requires=">= 3.7",
     classifiers=[
         "Development Status :: 5 - Production/Stable",
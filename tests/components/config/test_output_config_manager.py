@@ -11,6 +11,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import os
 from pathlib import Path
 from unittest import mock
 
@@ -196,3 +197,25 @@ def test_get_live_deployment_by_id_raises_when_live_deployment_with_given_id_doe
 
     with pytest.raises(Exception):
         manager.get_live_deployment_by_id(123)
+
+
+def test_get_latest_output_directory_returns_most_recently_modified_output() -> None:
+    create_fake_lean_cli_directory()
+
+    for index, name in enumerate(["2021-01-01_00-00-00", "2021-01-03_00-00-00", "2021-01-02_00-00-00"]):
+        directory = _create_directory(Path.cwd() / "Python Project" / "live" / name)
+        output_file = directory / "L-123.json"
+        output_file.write_text("{}", encoding="utf-8")
+        os.utime(output_file, (index, index))
+
+    manager = _create_output_config_manager()
+
+    assert manager.get_latest_output_directory("live") == Path.cwd() / "Python Project" / "live" / "2021-01-02_00-00-00"
+
+
+def test_get_latest_output_directory_returns_none_when_there_is_no_output() -> None:
+    create_fake_lean_cli_directory()
+
+    manager = _create_output_config_manager()
+
+    assert manager.get_latest_output_directory("live") is None
@@ -12,7 +12,9 @@
 # limitations under the License.
 
 import json
+import math
 from pathlib import Path
+from unittest import mock
 
 from lean.components.config.storage import Storage
 
@@ -119,3 +121,56 @@ def test_clear_deletes_file() -> None:
     storage.clear()
 
     assert not path.exists()
+
+
+def test_batch_saves_all_changes_at_the_end_of_the_block() -> None:
+    path = Path.cwd() / "config.json"
+    with path.open("w+", encoding="utf-8") as file:
+        file.write('{ "key": "value" }')
+
+    storage = Storage(str(path))
+    with storage.batch():
+        storage.set("key", "new-value")
+        storage.set("key2", "value2")
+        storage.delete("key3")
+
+        data = json.loads(path.read_text(encoding="utf-8"))
+        assert data == {"key": "value"}
+
+    data = json.loads(path.read_text(encoding="utf-8"))
+    assert data == {"key": "new-value", "key2": "value2"}
+
+
+def test_batch_does_not_create_file_when_nothing_changed() -> None:
+    path = Path.cwd() / "config.json"
+
+    storage = Storage(str(path))
+    with storage.batch():
+        pass
+
+    assert not path.exists()
+
+
+def test_get_falls_back_to_json_when_orjson_rejects_content() -> None:
+    path = Path.cwd() / "config.json"
+    with path.open("w+", encoding="utf-8") as file:
+        file.write('{ "key": "value" }')
+
+    orjson_loads = mock.Mock(side_effect=ValueError("unsupported content"))
+    with mock.patch("lean.components.config.storage._orjson_loads", orjson_loads):
+        storage = Storage(str(path))
+
+    orjson_loads.assert_called_once()
+    assert storage.get("key") == "value"
+    assert path.is_file()
+
+
+def test_get_reads_nan_values_from_file() -> None:
+    path = Path.cwd() / "config.json"
+    with path.open("w+", encoding="utf-8") as file:
+        file.write('{ "key": NaN }')
+
+    storage = Storage(str(path))
+
+    assert math.isnan(storage.get("key"))
+    assert path.is_file()
@@ -102,6 +102,149 @@ def test_get_project_by_id_raises_error_when_no_project_with_given_id_exists() -
         project_manager.get_project_by_id(max(python_project_id, csharp_project_id) + 1)
 
 
+def test_get_project_by_id_does_not_search_data_directory() -> None:
+    create_fake_lean_cli_directory()
+
+    project_dir = Path.cwd() / "data" / "Data Project"
+    project_dir.mkdir()
+
+    project_config_manager = ProjectConfigManager(XMLManager())
+    project_id = project_config_manager.get_local_id(project_dir)
+
+    project_manager = _create_project_manager()
+
+    with pytest.raises(Exception):
+        project_manager.get_project_by_id(project_id)
+
+
+def test_get_project_by_id_searches_directories_skipped_by_get_local_projects() -> None:
+    create_fake_lean_cli_directory()
+
+    project_dir = Path.cwd() / "venv" / "Nested Project"
+    project_dir.mkdir(parents=True)
+
+    project_config_manager = ProjectConfigManager(XMLManager())
+    project_id = project_config_manager.get_local_id(project_dir)
+
+    project_manager = _create_project_manager()
+
+    assert project_manager.get_project_by_id(project_id) == project_dir
+
+
+def test_try_get_project_path_by_cloud_id_returns_path_to_project() -> None:
+    create_fake_lean_cli_directory()
+
+    project_dir = Path.cwd() / "Library" / "Python Library"
+    ProjectConfigManager(XMLManager()).get_project_config(project_dir).set("cloud-id", 1234)
+
+    project_manager = _create_project_manager()
+
+    assert project_manager.try_get_project_path_by_cloud_id(1234) == project_dir
+
+
+def test_try_get_project_path_by_cloud_id_returns_false_when_no_project_with_given_id_exists() -> None:
+    create_fake_lean_cli_directory()
+
+    project_config_manager = ProjectConfigManager(XMLManager())
+    project_config_manager.get_project_config(Path.cwd() / "Python Project").set("cloud-id", 1234)
+    project_config_manager.get_project_config(Path.cwd() / "CSharp Project").set("local-id", 123)
+
+    project_manager = _create_project_manager()
+
+    assert not project_manager.try_get_project_path_by_cloud_id(123)
+
+
+def test_try_get_project_path_by_cloud_id_does_not_require_data_folder_in_lean_config() -> None:
+    create_fake_lean_cli_directory()
+
+    (Path.cwd() / "lean.json").write_text("{}", encoding="utf-8")
+
+    project_dir = Path.cwd() / "Python Project"
+    ProjectConfigManager(XMLManager()).get_project_config(project_dir).set("cloud-id", 5)
+
+    project_manager = _create_project_manager()
+
+    assert project_manager.try_get_project_path_by_cloud_id(5) == project_dir
+
+
+def test_try_get_project_path_by_cloud_id_searches_directories_inside_projects() -> None:
+    create_fake_lean_cli_directory()
+
+    project_dir = Path.cwd() / "Python Project" / "bin" / "Nested Project"
+    ProjectConfigManager(XMLManager()).get_project_config(project_dir).set("cloud-id", 1234)
+
+    project_manager = _create_project_manager()
+
+    assert project_manager.try_get_project_path_by_cloud_id(1234) == project_dir
+
+
+def test_try_get_project_path_by_cloud_id_follows_symlinked_directories() -> None:
+    create_fake_lean_cli_directory()
+
+    target_dir = Path.home() / "Linked Project"
+    ProjectConfigManager(XMLManager()).get_project_config(target_dir).set("cloud-id", 1234)
+
+    project_dir = Path.cwd() / "Linked Project"
+    project_dir.symlink_to(target_dir, target_is_directory=True)
+
+    project_manager = _create_project_manager()
+
+    assert project_manager.try_get_project_path_by_cloud_id(1234) == project_dir
+
+
+def test_try_get_project_path_by_cloud_id_terminates_on_symlink_cycles() -> None:
+    create_fake_lean_cli_directory()
+
+    (Path.cwd() / "Library" / "Loop").symlink_to(Path.cwd(), target_is_directory=True)
+
+    project_manager = _create_project_manager()
+
+    assert not project_manager.try_get_project_path_by_cloud_id(123)
+
+
+def test_get_local_projects_returns_all_projects() -> None:
+    create_fake_lean_cli_directory()
+
+    project_manager = _create_project_manager()
+
+    assert set(project_manager.get_local_projects(Path.cwd())) == {
+        Path.cwd() / "Python Project",
+        Path.cwd() / "CSharp Project",
+        Path.cwd() / "Library/Python Library",
+        Path.cwd() / "Library/CSharp Library"
+    }
+
+
+def test_get_local_projects_skips_ignored_directories() -> None:
+    create_fake_lean_cli_directory()
+
+    for directory in ["venv", ".git", "Python Project/bin", "CSharp Project/obj", "Python Project/backtests"]:
+        path = Path.cwd() / directory / "Nested Project"
+        path.mkdir(parents=True)
+        (path / "config.json").write_text("{}", encoding="utf-8")
+
+    project_manager = _create_project_manager()
+
+    assert set(project_manager.get_local_projects(Path.cwd())) == {
+        Path.cwd() / "Python Project",
+        Path.cwd() / "CSharp Project",
+        Path.cwd() / "Library/Python Library",
+        Path.cwd() / "Library/CSharp Library"
+    }
+
+
+def test_get_local_projects_searches_output_directory_names_outside_projects() -> None:
+    create_fake_lean_cli_directory()
+
+    project_dir = Path.cwd() / "live" / "Live Project"
+    project_dir.mkdir(parents=True)
+    (project_dir / "config.json").write_text("{}", encoding="utf-8")
+
+    project_manager = _create_project_manager()
+
+    assert project_dir in project_manager.get_local_projects(Path.cwd())
+
+
 def test_get_source_files_returns_all_source_files() -> None:
     project_path = Path.cwd() / "My Project"
     project_path.mkdir()
@@ -72,7 +72,7 @@ def _assert_pull_manager_adds_property_to_project_config(prop: str,
             return None
         return []
 
-    project_config = mock.Mock()
+    project_config = mock.MagicMock()
     project_config.get = mock.MagicMock(side_effect=config_get_side_effect)
     project_config.set = mock.Mock()
 
@@ -119,7 +119,7 @@ def _assert_pull_manager_removes_property_from_project_config(prop: str, cloud_p
             return None
         return []
 
-    project_config = mock.Mock()
+    project_config = mock.MagicMock()
     project_config.get = mock.MagicMock(side_effect=config_get_side_effect)
     project_config.set = mock.Mock()
     project_config.delete = mock.Mock()
@@ -333,7 +333,7 @@ def test_pull_projects_updates_lean_config() -> None:
             return None
         return []
 
-    project_config = mock.Mock()
+    project_config = mock.MagicMock()
     project_config.get = mock.MagicMock(side_effect=config_get_side_effect)
 
     project_config_manager = mock.Mock()
@@ -399,7 +399,7 @@ def test_push_projects_updates_name_in_cloud_if_required(unsupported_character:
     api_client.projects.get_all.return_value = cloud_projects
     api_client.files.get_all = mock.MagicMock(return_value=[])
 
-    project_config = mock.Mock()
+    project_config = mock.MagicMock()
     project_config.get = mock.MagicMock(return_value=[])    # get("libraries")
 
     project_config_manager = mock.Mock()
@@ -440,7 +440,7 @@ def test_pull_projects_renames_project_if_required(test_platform: str, unsupport
     api_client.files.get_all = mock.MagicMock(return_value=[])
     api_client.projects.create = mock.MagicMock(return_value=cloud_projects[0])
 
-    project_config = mock.Mock()
+    project_config = mock.MagicMock()
     project_config.get = mock.MagicMock(return_value=[])
 
     project_config_manager = mock.Mock()